@@ -1,16 +1,25 @@
 import sys
 import logging
+import pathlib
 from collections import deque
 from itertools import chain
 
+# the shared instrumentation lives at the repository root
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from edaf05_profiling import profiled  # noqa: E402
+
 _log = logging.getLogger(__name__)
 _log.setLevel(logging.WARNING)
 
 
 def main() -> int:
-    n_persons, women_pref, men_pref = _parse_input()
-    result = _compute_stable_matching(n_persons, women_pref, men_pref)
-    _display_results(result)
+    with profiled('1stablemarriage') as profiler:
+        with profiler.phase('parse'):
+            n_persons, women_pref, men_pref = _parse_input()
+        with profiler.phase('solve'):
+            result = _compute_stable_matching(n_persons, women_pref, men_pref)
+        with profiler.phase('output'):
+            _display_results(result)
 
     return 0
 
@@ -1,18 +1,29 @@
 import sys
 import collections
-from typing import Generator
+import pathlib
+from typing import Generator, Iterable
 
 from node import Node
 
+# the shared instrumentation lives at the repository root
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from edaf05_profiling import profiled  # noqa: E402
+
 
 def main() -> int:
-    words, word_pairs = _parse_input()
+    with profiled('2wordladders') as profiler:
+        with profiler.phase('parse'):
+            words, word_pairs = _parse_input()
 
-    _populate_adjacency_lists(words)
+        with profiler.phase('build'):
+            _populate_adjacency_lists(words)
 
-    shortest_path_lengths = _find_shortest_path_lengths(words, word_pairs)
+        with profiler.phase('solve'):
+            # consume the generator here, so the searches are attributed to this phase
+            shortest_path_lengths = list(_find_shortest_path_lengths(words, word_pairs))
 
-    _print_result(shortest_path_lengths)
+        with profiler.phase('output'):
+            _print_result(shortest_path_lengths)
 
     return 0
 
@@ -144,7 +155,7 @@ def _count_length(final_node: Node, from_word: Node) -> int:
     return length
 
 
-def _print_result(shortest_path_lengths: Generator[int | str, None, None]) -> None:
+def _print_result(shortest_path_lengths: Iterable[int | str]) -> None:
     """Display results to stdout."""
     for shortest_path_length in shortest_path_lengths:
         print(shortest_path_length)
@@ -0,0 +1,157 @@
+"""Benchmarks for the minimal spanning tree engines.
+
+Run from this directory, either on an input file or on a synthetic graph:
+
+    python benchmark.py data/secret/2med.in
+    python benchmark.py --vertices 20000 --edges 200000 --engines streaming
+    python benchmark.py --vertices 1000000 --edges 10000000 --engines boruvka
+
+`streaming` checks the streaming engine against a from-scratch Kruskal at
+checkpoints; `boruvka` compares the vectorized Borůvka engine with Prim in `main.py`.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections import abc
+
+import numpy as np
+
+import main as prim
+from boruvka import find_minimal_spanning_tree_weight, load_edges
+from streaming import StreamingMinimalSpanningTree
+
+Edge = tuple[int, int, int]
+ENGINES = ('streaming', 'boruvka')
+
+
+def main() -> int:
+    args = _parse_args()
+    if args.input:
+        with open(args.input, 'rb') as file:
+            n_vertices, sources, targets, weights = load_edges(file)
+    else:
+        n_vertices, sources, targets, weights = _generate_graph(args.vertices, args.edges, args.seed)
+
+    print(f'{n_vertices} vertices, {len(weights)} edges')
+    if 'streaming' in args.engines:
+        edges = list(zip(sources.tolist(), targets.tolist(), weights.tolist()))
+        benchmark_streaming(n_vertices, edges, args.checkpoints)
+    if 'boruvka' in args.engines:
+        benchmark_boruvka(n_vertices, sources, targets, weights, args.skip_prim)
+
+    return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', nargs='?', help='graph in the lab input format')
+    parser.add_argument('--vertices', type=int, default=10_000)
+    parser.add_argument('--edges', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES))
+    parser.add_argument('--checkpoints', type=int, default=10, help='number of from-scratch comparisons')
+    parser.add_argument('--skip-prim', action='store_true', help='only time Borůvka, for graphs too large for Prim')
+    return parser.parse_args()
+
+
+def benchmark_streaming(n_vertices: int, edges: list[Edge], n_checkpoints: int) -> None:
+    """Stream all edges, recomputing from scratch at evenly spaced checkpoints."""
+    step = max(1, len(edges) // max(1, n_checkpoints))
+    spanning_tree = StreamingMinimalSpanningTree(n_vertices)
+    streaming_ns = 0
+    scratch_ns = 0
+
+    print(f'{"edges":>10} {"streaming total":>16} {"stream ms":>10} {"scratch ms":>11}')
+    for index, (vertex_1, vertex_2, weight) in enumerate(edges, start=1):
+        start = time.perf_counter_ns()
+        total = spanning_tree.add_edge(vertex_1, vertex_2, weight)
+        streaming_ns += time.perf_counter_ns() - start
+
+        if index % step and index != len(edges):
+            continue
+
+        start = time.perf_counter_ns()
+        expected = kruskal_total(n_vertices, edges[:index])
+        elapsed_ns = time.perf_counter_ns() - start
+        scratch_ns += elapsed_ns
+
+        if total != expected:
+            raise AssertionError(f'streaming total {total} != {expected} after {index} edges')
+        print(f'{index:>10} {total:>16} {streaming_ns / 1e6:>10.1f} {elapsed_ns / 1e6:>11.1f}')
+
+    print(f'streaming: {streaming_ns / max(1, len(edges)) / 1e3:.2f} us/edge in total {streaming_ns / 1e6:.1f} ms')
+    print(f'from scratch: {scratch_ns / 1e6:.1f} ms over all checkpoints')
+
+
+def benchmark_boruvka(
+    n_vertices: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+    skip_prim: bool,
+) -> None:
+    start = time.perf_counter_ns()
+    total = find_minimal_spanning_tree_weight(n_vertices, sources, targets, weights)
+    boruvka_ms = (time.perf_counter_ns() - start) / 1e6
+    print(f'boruvka: total {total} in {boruvka_ms:.1f} ms')
+    if skip_prim:
+        return
+
+    start = time.perf_counter_ns()
+    graph = [prim.Node(id_=id_) for id_ in range(n_vertices)]
+    for vertex_1, vertex_2, weight in zip(sources.tolist(), targets.tolist(), weights.tolist()):
+        prim._add_edge_between_nodes(vertex_1, vertex_2, weight, graph)
+    build_ms = (time.perf_counter_ns() - start) / 1e6
+
+    start = time.perf_counter_ns()
+    expected = sum(node.cost for node in prim.find_minimal_spanning_tree(graph))
+    prim_ms = (time.perf_counter_ns() - start) / 1e6
+    print(f'prim: total {expected} in {prim_ms:.1f} ms (+ {build_ms:.1f} ms building the node lists)')
+    print(f'speedup: {prim_ms / boruvka_ms:.1f}x, {(prim_ms + build_ms) / boruvka_ms:.1f}x including the build')
+
+    if total != expected:
+        raise AssertionError(f'boruvka total {total} != prim total {expected}')
+
+
+def kruskal_total(n_vertices: int, edges: abc.Iterable[Edge]) -> int:
+    """Minimal spanning forest weight, used as a reference that also handles disconnected prefixes."""
+    parent = list(range(n_vertices))
+
+    def find(vertex: int) -> int:
+        while parent[vertex] != vertex:
+            parent[vertex] = parent[parent[vertex]]
+            vertex = parent[vertex]
+        return vertex
+
+    total = 0
+    for vertex_1, vertex_2, weight in sorted(edges, key=lambda edge: edge[2]):
+        root_1, root_2 = find(vertex_1), find(vertex_2)
+        if root_1 != root_2:
+            parent[root_1] = root_2
+            total += weight
+
+    return total
+
+
+def _generate_graph(n_vertices: int, n_edges: int, seed: int) -> tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """Random connected graph (0-indexed): a random spanning path plus uniformly random edges."""
+    rng = np.random.default_rng(seed)
+    path = rng.permutation(n_vertices)
+
+    n_random = max(0, n_edges - (n_vertices - 1))
+    random_sources = rng.integers(0, n_vertices, n_random)
+    # an offset in 1..n-1 keeps the endpoints distinct
+    random_targets = (random_sources + rng.integers(1, max(2, n_vertices), n_random)) % n_vertices
+
+    sources = np.concatenate((path[:-1], random_sources))
+    targets = np.concatenate((path[1:], random_targets))
+    weights = rng.integers(1, 10**6, len(sources), endpoint=True)
+
+    shuffle = rng.permutation(len(sources))
+    return n_vertices, sources[shuffle], targets[shuffle], weights[shuffle]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
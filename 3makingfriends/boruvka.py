@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+
+
+def main() -> int:
+    n_vertices, sources, targets, weights = load_edges(sys.stdin.buffer)
+
+    print(find_minimal_spanning_tree_weight(n_vertices, sources, targets, weights))
+
+    return 0
+
+
+def load_edges(stream) -> tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """Load the graph as edge arrays (0-indexed vertices) from a binary stream."""
+    numbers = np.array(stream.read().split(), dtype=np.int64)
+    n_vertices, n_edges = int(numbers[0]), int(numbers[1])
+    edges = numbers[2:2 + 3 * n_edges].reshape(n_edges, 3)
+
+    # -1 to align indices in input with vertex identifiers, as in `main._load_graph`
+    return n_vertices, edges[:, 0] - 1, edges[:, 1] - 1, edges[:, 2]
+
+
+def find_minimal_spanning_tree_weight(
+    n_vertices: int,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    weights: np.ndarray,
+) -> int:
+    """Weight of a minimal spanning forest, by Borůvka's algorithm on edge arrays.
+
+    Every round, each component picks its cheapest outgoing edge with a grouped
+    minimum, the picked edges are added, and the components they join are
+    contracted with pointer jumping. Edges are kept sorted by weight, so an edge's
+    position breaks ties between equal weights consistently and the picked edges
+    never form a cycle. Edges inside a component are dropped after each round, so
+    a round costs a handful of array passes over the remaining edges, and there
+    are at most log2(V) rounds.
+    """
+    order = np.argsort(weights)
+    # endpoints are component labels from here on; initially every vertex is its own
+    sources, targets, weights = sources[order], targets[order], weights[order]
+
+    total = 0
+    unpicked = len(weights)
+    while True:
+        # drop edges inside a component
+        external = sources != targets
+        sources, targets, weights = sources[external], targets[external], weights[external]
+        if not len(weights):
+            return total
+
+        # position of the cheapest edge leaving each component
+        cheapest = np.full(n_vertices, unpicked, dtype=np.int64)
+        positions = np.arange(len(weights))
+        np.minimum.at(cheapest, sources, positions)
+        np.minimum.at(cheapest, targets, positions)
+
+        components = np.flatnonzero(cheapest < unpicked)
+        # a mask rather than np.unique: two components may pick the same edge
+        picked = np.zeros(len(weights), dtype=bool)
+        picked[cheapest[components]] = True
+        total += int(weights[picked].sum())
+
+        # point each component at the one its cheapest edge leads to
+        parent = np.arange(n_vertices)
+        edges = cheapest[components]
+        parent[components] = np.where(sources[edges] == components, targets[edges], sources[edges])
+        # two components that picked the same edge point at each other; the smaller becomes the root
+        mutual = (parent[parent[components]] == components) & (components < parent[components])
+        parent[components[mutual]] = components[mutual]
+
+        # pointer jumping until every label points at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+        sources, targets = parent[sources], parent[targets]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+
+class LinkCutTree:
+    """Forest of rooted trees with path-maximum queries (Sleator-Tarjan).
+
+    Nodes are plain integers in ``1..size``; index 0 is a null sentinel. Every node
+    carries a value, and ``path_max`` returns the node of largest value on the tree
+    path between two nodes. All operations are O(log n) amortized.
+
+    The tree state is kept in parallel lists rather than per-node objects, since
+    attribute lookups dominate the running time of splay operations in Python.
+    """
+
+    def __init__(self) -> None:
+        # index 0 is the null node; its value must never win a max comparison
+        self._left: list[int] = [0]
+        self._right: list[int] = [0]
+        self._parent: list[int] = [0]
+        self._reversed: list[bool] = [False]
+        self._value: list[int | float] = [float('-inf')]
+        self._max: list[int] = [0]  # node of largest value in the splay subtree
+
+    def add_node(self, value: int | float = float('-inf')) -> int:
+        """Add an isolated node and return its identifier."""
+        self._left.append(0)
+        self._right.append(0)
+        self._parent.append(0)
+        self._reversed.append(False)
+        self._value.append(value)
+        node = len(self._value) - 1
+        self._max.append(node)
+        return node
+
+    def reset_node(self, node: int, value: int | float) -> None:
+        """Reuse an isolated node with a new value."""
+        self._left[node] = self._right[node] = self._parent[node] = 0
+        self._reversed[node] = False
+        self._value[node] = value
+        self._max[node] = node
+
+    def value(self, node: int) -> int | float:
+        return self._value[node]
+
+    def link(self, child: int, parent: int) -> None:
+        """Add the edge (child, parent); the nodes must be in different trees."""
+        self._make_root(child)
+        self._parent[child] = parent
+
+    def cut(self, node_1: int, node_2: int) -> None:
+        """Remove the edge (node_1, node_2), which must exist."""
+        self._make_root(node_1)
+        self._access(node_2)
+        self._splay(node_2)
+        # node_1 is now the only node left of node_2 in its preferred path
+        self._left[node_2] = 0
+        self._parent[node_1] = 0
+        self._update(node_2)
+
+    def connected(self, node_1: int, node_2: int) -> bool:
+        return node_1 == node_2 or self._find_root(node_1) == self._find_root(node_2)
+
+    def path_max(self, node_1: int, node_2: int) -> int:
+        """Return the node of largest value on the path between two connected nodes."""
+        self._make_root(node_1)
+        self._access(node_2)
+        self._splay(node_2)
+        return self._max[node_2]
+
+    def _is_splay_root(self, node: int) -> bool:
+        parent = self._parent[node]
+        return parent == 0 or (self._left[parent] != node and self._right[parent] != node)
+
+    def _update(self, node: int) -> None:
+        value, best = self._value, node
+        left, right = self._max[self._left[node]], self._max[self._right[node]]
+        if value[left] > value[best]:
+            best = left
+        if value[right] > value[best]:
+            best = right
+        self._max[node] = best
+
+    def _push_down(self, node: int) -> None:
+        if not self._reversed[node]:
+            return
+
+        self._reversed[node] = False
+        left, right = self._left[node], self._right[node]
+        self._left[node], self._right[node] = right, left
+        # the null node may be flagged here, but it is never read through
+        self._reversed[left] = not self._reversed[left]
+        self._reversed[right] = not self._reversed[right]
+
+    def _rotate(self, node: int) -> None:
+        left, right, parent_of = self._left, self._right, self._parent
+        parent = parent_of[node]
+        grandparent = parent_of[parent]
+
+        if not self._is_splay_root(parent):
+            if left[grandparent] == parent:
+                left[grandparent] = node
+            else:
+                right[grandparent] = node
+        parent_of[node] = grandparent
+
+        if left[parent] == node:
+            left[parent] = child = right[node]
+            right[node] = parent
+        else:
+            right[parent] = child = left[node]
+            left[node] = parent
+        if child:
+            parent_of[child] = parent
+        parent_of[parent] = node
+
+        self._update(parent)
+        self._update(node)
+
+    def _splay(self, node: int) -> None:
+        # pending reversals have to be resolved top-down before rotating
+        path = [node]
+        while not self._is_splay_root(path[-1]):
+            path.append(self._parent[path[-1]])
+        for ancestor in reversed(path):
+            self._push_down(ancestor)
+
+        left, parent_of = self._left, self._parent
+        while not self._is_splay_root(node):
+            parent = parent_of[node]
+            if not self._is_splay_root(parent):
+                grandparent = parent_of[parent]
+                # zig-zig rotates the parent first, zig-zag the node itself
+                if (left[parent] == node) == (left[grandparent] == parent):
+                    self._rotate(parent)
+                else:
+                    self._rotate(node)
+            self._rotate(node)
+
+    def _access(self, node: int) -> None:
+        """Make the root-to-node path preferred, ending with node on top of its splay tree."""
+        previous = 0
+        current = node
+        while current:
+            self._splay(current)
+            self._right[current] = previous
+            self._update(current)
+            previous = current
+            current = self._parent[current]
+        self._splay(node)
+
+    def _make_root(self, node: int) -> None:
+        self._access(node)
+        self._reversed[node] = not self._reversed[node]
+
+    def _find_root(self, node: int) -> int:
+        self._access(node)
+        self._push_down(node)
+        while self._left[node]:
+            node = self._left[node]
+            self._push_down(node)
+        self._splay(node)
+        return node
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import copy
+import pathlib
 import sys
 from dataclasses import dataclass, field
 from collections import abc
 import heapq
 
+# the shared instrumentation lives at the repository root
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from edaf05_profiling import profiled  # noqa: E402
+
 
 @dataclass
 class Node:
@@ -22,11 +27,15 @@ class Node:
 
 
 def main() -> int:
-    graph = _load_graph()
+    with profiled('3makingfriends') as profiler:
+        with profiler.phase('build'):
+            graph = _load_graph()
 
-    minimal_spanning_tree = find_minimal_spanning_tree(graph)
+        with profiler.phase('solve'):
+            minimal_spanning_tree = find_minimal_spanning_tree(graph)
 
-    print(sum(node.cost for node in minimal_spanning_tree))
+        with profiler.phase('output'):
+            print(sum(node.cost for node in minimal_spanning_tree))
 
     return 0
 
@@ -125,19 +134,22 @@ def find_minimal_spanning_tree(graph: list[Node]) -> list[Node]:
     # no cost of adding first node
     source.cost = 0
     # priority queue to keep track of the closest adjacent nodes
-    # initialize with an arbitrary node
-    adjacent_nodes = [source]
-    heapq.heapify(adjacent_nodes)
+    # initialize with an arbitrary node; entries are (cost, id_) pairs, as a node's
+    # cost may decrease while it is in the queue, which would break the heap order
+    adjacent_nodes = [(source.cost, source.id_)]
 
     # index nodes by id_ for quick lookup
     minimal_spanning_tree = [None] * len(graph)
+    n_nodes_in_tree = 0
 
-    while not all(minimal_spanning_tree):
-        nearest_node = heapq.heappop(adjacent_nodes)
+    while n_nodes_in_tree < len(graph):
+        _, nearest_index = heapq.heappop(adjacent_nodes)
+        nearest_node = graph[nearest_index]
 
         # if this node is not already in mst
         if not minimal_spanning_tree[nearest_node.id_]:
             minimal_spanning_tree[nearest_node.id_] = nearest_node
+            n_nodes_in_tree += 1
 
             for local_index, neighbor_index in enumerate(nearest_node.neighbors):
                 neighbor = graph[neighbor_index]
@@ -146,7 +158,7 @@ def find_minimal_spanning_tree(graph: list[Node]) -> list[Node]:
 
                 if (new_cost := nearest_node.weights[local_index]) < neighbor.cost:
                     neighbor.cost = new_cost
-                    heapq.heappush(adjacent_nodes, neighbor)
+                    heapq.heappush(adjacent_nodes, (new_cost, neighbor.id_))
 
     return minimal_spanning_tree
 
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import sys
+from collections import abc
+
+from link_cut_tree import LinkCutTree
+
+
+class StreamingMinimalSpanningTree:
+    """Maintain a minimal spanning forest while edges arrive one at a time.
+
+    Every vertex and every forest edge is a node in a link-cut tree; an edge node
+    carries the edge weight, so the heaviest edge on a tree path is a path-max query.
+    An incoming edge that closes a cycle replaces the heaviest edge on that cycle if
+    it is lighter. Each edge costs O(log V) amortized, and `total` is the weight of
+    the minimal spanning forest of all edges added so far.
+    """
+
+    def __init__(self, n_vertices: int) -> None:
+        self.total = 0
+        self._tree = LinkCutTree()
+        # vertex identifier i is link-cut node i + 1
+        for _ in range(n_vertices):
+            self._tree.add_node()
+        # endpoints of each edge node currently in the forest; freed edge nodes are reused
+        self._endpoints: dict[int, tuple[int, int]] = {}
+        self._free_edge_nodes: list[int] = []
+
+    def add_edge(self, vertex_1: int, vertex_2: int, weight: int) -> int:
+        """Add an edge between two vertices (0-indexed) and return the updated total."""
+        node_1, node_2 = vertex_1 + 1, vertex_2 + 1
+        tree = self._tree
+
+        if node_1 == node_2:
+            return self.total
+
+        if tree.connected(node_1, node_2):
+            heaviest = tree.path_max(node_1, node_2)
+            heaviest_weight = tree.value(heaviest)
+            if heaviest_weight <= weight:
+                # the new edge would be the heaviest on its cycle
+                return self.total
+
+            end_1, end_2 = self._endpoints.pop(heaviest)
+            tree.cut(end_1, heaviest)
+            tree.cut(heaviest, end_2)
+            self._free_edge_nodes.append(heaviest)
+            self.total -= heaviest_weight
+
+        edge_node = self._new_edge_node(weight)
+        self._endpoints[edge_node] = (node_1, node_2)
+        tree.link(edge_node, node_1)
+        tree.link(node_2, edge_node)
+        self.total += weight
+
+        return self.total
+
+    def _new_edge_node(self, weight: int) -> int:
+        if self._free_edge_nodes:
+            edge_node = self._free_edge_nodes.pop()
+            self._tree.reset_node(edge_node, weight)
+            return edge_node
+
+        return self._tree.add_node(weight)
+
+
+def main() -> int:
+    lines = iter(sys.stdin)
+    n_vertices, _ = _parse_row(next(lines))
+
+    total = 0
+    for total in stream_minimal_spanning_tree_weights(n_vertices, _read_edges(lines)):
+        pass
+
+    print(total)
+
+    return 0
+
+
+def stream_minimal_spanning_tree_weights(
+    n_vertices: int,
+    edges: abc.Iterable[tuple[int, int, int]]
+) -> abc.Generator[int, None, None]:
+    """Yield the minimal spanning forest weight after each edge (1-indexed vertices)."""
+    spanning_tree = StreamingMinimalSpanningTree(n_vertices)
+    for node_index_1, node_index_2, weight in edges:
+        # -1 to align indices in input with vertex identifiers, as in `main._load_graph`
+        yield spanning_tree.add_edge(node_index_1 - 1, node_index_2 - 1, weight)
+
+
+def _read_edges(lines: abc.Iterable[str]) -> abc.Generator[tuple[int, int, int], None, None]:
+    """Read `u v w` rows lazily, so edges are processed as they arrive."""
+    for line in lines:
+        if line.strip():
+            yield _parse_row(line)
+
+
+def _parse_row(line: str) -> tuple[int, ...]:
+    return tuple(int(nbr) for nbr in line.split())
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Build and query throughput of the k-d tree spatial index.
+
+Run from this directory, either on an input file or on a synthetic point cloud:
+
+    python benchmark.py data/secret/6huge.in
+    python benchmark.py --points 10000000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from spatial_index import KDTree
+
+
+def main() -> int:
+    args = _parse_args()
+    rng = np.random.default_rng(args.seed)
+    if args.input:
+        with open(args.input) as file:
+            points = np.loadtxt(file, skiprows=1, ndmin=2)
+    else:
+        points = rng.uniform(-10**7, 10**7, size=(args.points, 2))
+
+    print(f'{len(points):,} points')
+    start = time.perf_counter()
+    tree = KDTree(points, leaf_size=args.leaf_size)
+    _report('build', len(points), time.perf_counter() - start)
+
+    queries = rng.uniform(points.min(axis=0), points.max(axis=0), size=(args.queries, points.shape[1]))
+    start = time.perf_counter()
+    distances, neighbors = tree.query(queries)
+    _report('nearest neighbour', len(queries), time.perf_counter() - start)
+    _check_nearest(points, queries[:100], distances[:100])
+
+    start = time.perf_counter()
+    distances, neighbors = tree.all_nearest_neighbors()
+    _report('all nearest neighbours', len(points), time.perf_counter() - start)
+    index = int(np.argmin(distances))
+    print(f'closest pair: {distances[index]:.6f} between points {index} and {neighbors[index]}')
+
+    # a radius that gives a few neighbours per point
+    radius = 2 * float(np.median(distances))
+    start = time.perf_counter()
+    pairs = tree.pairs_within(radius)
+    _report(f'pairs closer than {radius:.3g} ({len(pairs):,} pairs)', len(points), time.perf_counter() - start)
+
+    return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', nargs='?', help='points in the lab input format')
+    parser.add_argument('--points', type=int, default=10_000_000, help='size of the synthetic cloud')
+    parser.add_argument('--queries', type=int, default=1_000_000, help='arbitrary nearest neighbour queries')
+    parser.add_argument('--leaf-size', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+def _report(label: str, n_items: int, elapsed_s: float) -> None:
+    print(f'{label}: {elapsed_s:.2f} s, {n_items / elapsed_s:,.0f} points/s')
+
+
+def _check_nearest(points: np.ndarray, queries: np.ndarray, distances: np.ndarray) -> None:
+    """Compare a few nearest neighbour distances with a brute-force scan."""
+    for query, distance in zip(queries, distances):
+        expected = np.sqrt(((points - query) ** 2).sum(axis=1).min())
+        if not np.isclose(distance, expected):
+            raise AssertionError(f'nearest neighbour of {query}: {distance} != {expected}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
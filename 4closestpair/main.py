@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import numpy as np
+
+from spatial_index import KDTree
+
+# the shared instrumentation lives at the repository root
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from edaf05_profiling import profiled  # noqa: E402
+
+
+def main() -> int:
+    with profiled('4closestpair') as profiler:
+        with profiler.phase('parse'):
+            points = _parse_input()
+
+        with profiler.phase('build'):
+            tree = KDTree(points)
+
+        with profiler.phase('solve'):
+            distance, _, _ = tree.closest_pair()
+
+        with profiler.phase('output'):
+            print(f'{distance:.6f}')
+
+    return 0
+
+
+def _parse_input() -> np.ndarray:
+    """Read the number of points followed by one `x y` row per point."""
+    n_points, *coordinates = sys.stdin.buffer.read().split()
+    return np.array(coordinates, dtype=np.float64).reshape(int(n_points), 2)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
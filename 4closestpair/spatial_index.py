@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import numpy as np
+
+# queries answered together; bounds the size of the (query, node) frontier arrays
+DEFAULT_BATCH_SIZE = 1 << 15
+
+
+class KDTree:
+    """Array-backed k-d tree over a fixed point set.
+
+    The tree is complete and implicit: node i has children 2i + 1 and 2i + 2, every
+    leaf sits at the same depth, and each node's points are one contiguous range of
+    the permuted point array. Nodes are split at the median of their widest
+    dimension. The build sorts each dimension once and then, per level, stably
+    partitions those orders with a few array passes, so it runs in O(n log n)
+    without per-node Python objects.
+
+    Queries are answered in batches: all (query, node) pairs of a level whose
+    bounding box is within the current search radius are expanded together, and the
+    surviving leaves are scanned as one padded array.
+    """
+
+    def __init__(self, points: np.ndarray, leaf_size: int = 16) -> None:
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or not len(points):
+            raise ValueError('expected a non-empty (n, k) array of points')
+        if leaf_size < 1:
+            raise ValueError(f'leaf size must be at least 1, got {leaf_size}')
+
+        n_points, n_dims = points.shape
+        n_levels = 0
+        while -(-n_points // (1 << n_levels)) > leaf_size:
+            n_levels += 1
+
+        self.n_levels = n_levels
+        self.points = points
+        self._first_leaf = (1 << n_levels) - 1
+
+        order, leaf_sizes = _partition(points, n_levels)
+        self._build_leaves(order, leaf_sizes)
+        self._build_boxes(n_dims)
+
+    def query(self, queries: np.ndarray, batch_size: int = DEFAULT_BATCH_SIZE) -> tuple[np.ndarray, np.ndarray]:
+        """Distance to and index of the nearest point of each query point."""
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, self.points.shape[1])
+        return self._nearest(queries, None, batch_size)
+
+    def all_nearest_neighbors(self, batch_size: int = DEFAULT_BATCH_SIZE) -> tuple[np.ndarray, np.ndarray]:
+        """Distance to and index of the nearest other point, for every point.
+
+        A point with no other point (a one-point cloud) gets distance inf and index -1.
+        """
+        return self._nearest(self.points, np.arange(len(self.points)), batch_size)
+
+    def closest_pair(self) -> tuple[float, int, int]:
+        """Distance and indices (i < j) of the closest pair of points."""
+        if len(self.points) < 2:
+            raise ValueError(f'a closest pair needs at least two points, got {len(self.points)}')
+        distances, neighbors = self.all_nearest_neighbors()
+        index = int(np.argmin(distances))
+        neighbor = int(neighbors[index])
+        return float(distances[index]), min(index, neighbor), max(index, neighbor)
+
+    def pairs_within(self, radius: float, batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+        """All index pairs (i, j), i < j, of points closer than `radius`, as an (m, 2) array."""
+        radius_2 = float(radius) ** 2
+        pairs = []
+        for start in range(0, len(self.points), batch_size):
+            query_ids = np.arange(start, min(start + batch_size, len(self.points)))
+            queries = self.points[query_ids]
+            pair_query, pair_leaf = self._leaves_within(queries, np.full(len(queries), radius_2), strict=True)
+
+            distances_2 = self._leaf_distances_2(queries, pair_query, pair_leaf)
+            neighbors = self._leaf_indices[pair_leaf]
+            # each pair once, and never a point with itself or with padding
+            close = (distances_2 < radius_2) & (neighbors > query_ids[pair_query, None])
+            rows, slots = np.nonzero(close)
+            pairs.append(np.column_stack((query_ids[pair_query[rows]], neighbors[rows, slots])))
+
+        return np.concatenate(pairs) if pairs else np.empty((0, 2), dtype=np.int64)
+
+    def _build_leaves(self, order: np.ndarray, leaf_sizes: np.ndarray) -> None:
+        """Lay out the points leaf by leaf, padded to a common leaf size with +inf."""
+        n_leaves, n_dims = len(leaf_sizes), self.points.shape[1]
+        leaf_starts = np.concatenate(([0], np.cumsum(leaf_sizes)[:-1]))
+        leaf_of_position = np.repeat(np.arange(n_leaves), leaf_sizes)
+        slot_of_position = np.arange(len(order)) - leaf_starts[leaf_of_position]
+
+        self._leaf_starts = leaf_starts
+        self._leaf_points = np.full((n_leaves, int(leaf_sizes.max()), n_dims), np.inf)
+        self._leaf_points[leaf_of_position, slot_of_position] = self.points[order]
+        self._leaf_indices = np.full((n_leaves, int(leaf_sizes.max())), -1, dtype=np.int64)
+        self._leaf_indices[leaf_of_position, slot_of_position] = order
+        self._leaf_of_point = np.empty(len(order), dtype=np.int64)
+        self._leaf_of_point[order] = leaf_of_position
+        self._ordered_points = self.points[order]
+
+    def _build_boxes(self, n_dims: int) -> None:
+        """Bounding boxes of all nodes, from the leaves up."""
+        n_nodes = 2 * self._first_leaf + 1
+        self._lower = np.empty((n_nodes, n_dims))
+        self._upper = np.empty((n_nodes, n_dims))
+        self._lower[self._first_leaf:] = np.minimum.reduceat(self._ordered_points, self._leaf_starts, axis=0)
+        self._upper[self._first_leaf:] = np.maximum.reduceat(self._ordered_points, self._leaf_starts, axis=0)
+
+        for level in reversed(range(self.n_levels)):
+            nodes = np.arange((1 << level) - 1, (1 << (level + 1)) - 1)
+            self._lower[nodes] = np.minimum(self._lower[2 * nodes + 1], self._lower[2 * nodes + 2])
+            self._upper[nodes] = np.maximum(self._upper[2 * nodes + 1], self._upper[2 * nodes + 2])
+
+    def _nearest(
+        self,
+        queries: np.ndarray,
+        query_ids: np.ndarray | None,
+        batch_size: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Nearest neighbours, skipping the point with the query's own id if ids are given."""
+        distances_2 = np.empty(len(queries))
+        neighbors = np.empty(len(queries), dtype=np.int64)
+
+        for start in range(0, len(queries), batch_size):
+            batch = slice(start, start + batch_size)
+            batch_queries = queries[batch]
+            batch_ids = None if query_ids is None else query_ids[batch]
+
+            # the leaf each query falls in gives a first search radius
+            own_leaf = self._descend(batch_queries) if batch_ids is None else self._leaf_of_point[batch_ids]
+            radius_2, _ = self._scan_leaves(batch_queries, batch_ids, np.arange(len(batch_queries)), own_leaf)
+
+            pair_query, pair_leaf = self._leaves_within(batch_queries, radius_2, strict=False)
+            pair_distance_2, pair_neighbor = self._scan_leaves(batch_queries, batch_ids, pair_query, pair_leaf)
+
+            # keep the best pair of every query: sort by query, then by distance
+            order = np.lexsort((pair_distance_2, pair_query))
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = pair_query[order[1:]] != pair_query[order[:-1]]
+            best = order[first]
+            distances_2[batch][pair_query[best]] = pair_distance_2[best]
+            neighbors[batch][pair_query[best]] = pair_neighbor[best]
+
+        # only the query's own point was in reach
+        neighbors[np.isinf(distances_2)] = -1
+        return np.sqrt(distances_2), neighbors
+
+    def _descend(self, queries: np.ndarray) -> np.ndarray:
+        """Leaf reached by always stepping into the child box closest to the query."""
+        nodes = np.zeros(len(queries), dtype=np.int64)
+        for _ in range(self.n_levels):
+            left = 2 * nodes + 1
+            closer_right = self._box_distances_2(queries, left + 1) < self._box_distances_2(queries, left)
+            nodes = left + closer_right
+        return nodes - self._first_leaf
+
+    def _leaves_within(
+        self,
+        queries: np.ndarray,
+        radius_2: np.ndarray,
+        strict: bool,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(query, leaf) pairs whose leaf box is within the query's squared radius."""
+        pair_query = np.arange(len(queries))
+        pair_node = np.zeros(len(queries), dtype=np.int64)
+        for _ in range(self.n_levels):
+            pair_query = np.repeat(pair_query, 2)
+            pair_node = (2 * np.repeat(pair_node, 2) + 1) + np.tile([0, 1], len(pair_node))
+            box_distances_2 = self._box_distances_2(queries[pair_query], pair_node)
+            within = box_distances_2 < radius_2[pair_query] if strict else box_distances_2 <= radius_2[pair_query]
+            pair_query, pair_node = pair_query[within], pair_node[within]
+
+        return pair_query, pair_node - self._first_leaf
+
+    def _scan_leaves(
+        self,
+        queries: np.ndarray,
+        query_ids: np.ndarray | None,
+        pair_query: np.ndarray,
+        pair_leaf: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Squared distance to and index of the nearest point in each pair's leaf."""
+        distances_2 = self._leaf_distances_2(queries, pair_query, pair_leaf)
+        neighbors = self._leaf_indices[pair_leaf]
+        if query_ids is not None:
+            distances_2[neighbors == query_ids[pair_query, None]] = np.inf
+
+        slots = np.argmin(distances_2, axis=1)
+        rows = np.arange(len(pair_leaf))
+        return distances_2[rows, slots], neighbors[rows, slots]
+
+    def _leaf_distances_2(self, queries: np.ndarray, pair_query: np.ndarray, pair_leaf: np.ndarray) -> np.ndarray:
+        differences = self._leaf_points[pair_leaf] - queries[pair_query, None, :]
+        return np.einsum('pmk,pmk->pm', differences, differences)
+
+    def _box_distances_2(self, queries: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        """Squared distance from each query to the bounding box of the matching node."""
+        outside = np.maximum(self._lower[nodes] - queries, 0) + np.maximum(queries - self._upper[nodes], 0)
+        return np.einsum('pk,pk->p', outside, outside)
+
+
+def _partition(points: np.ndarray, n_levels: int) -> tuple[np.ndarray, np.ndarray]:
+    """Order the points leaf by leaf, halving every node at the median of its widest dimension.
+
+    Returns the point order and the leaf sizes. Every dimension's sort order is kept
+    grouped by node; splitting a level is then a stable two-way partition within
+    each node, computed with cumulative sums instead of sorting again.
+    """
+    n_points, n_dims = points.shape
+    orders = [np.argsort(points[:, dim], kind='stable') for dim in range(n_dims)]
+    sizes = np.array([n_points])
+    positions = np.arange(n_points)
+
+    for _ in range(n_levels):
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        node_of_position = np.repeat(np.arange(len(sizes)), sizes)
+        rank_in_node = positions - starts[node_of_position]
+        left_sizes = sizes // 2
+
+        # split along the dimension in which the node is widest
+        spreads = np.stack([
+            points[order[starts + sizes - 1], dim] - points[order[starts], dim]
+            for dim, order in enumerate(orders)
+        ])
+        split_dims = np.argmax(spreads, axis=0)
+
+        goes_right = np.empty(n_points, dtype=bool)
+        for dim, order in enumerate(orders):
+            splits_here = split_dims[node_of_position] == dim
+            goes_right[order[splits_here]] = rank_in_node[splits_here] >= left_sizes[node_of_position[splits_here]]
+
+        for dim, order in enumerate(orders):
+            right = goes_right[order]
+            rights_before = np.cumsum(right) - right
+            rights_before -= rights_before[starts][node_of_position]
+            lefts_before = rank_in_node - rights_before
+            new_positions = starts[node_of_position] + np.where(
+                right,
+                left_sizes[node_of_position] + rights_before,
+                lefts_before,
+            )
+            partitioned = np.empty_like(order)
+            partitioned[new_positions] = order
+            orders[dim] = partitioned
+
+        sizes = np.column_stack((left_sizes, sizes - left_sizes)).ravel()
+
+    return orders[0], sizes
@@ -0,0 +1,143 @@
+"""Throughput of the online convex hull, optionally checked against the batch Graham scan.
+
+Run from this directory, either on an input file or on synthetic points:
+
+    python benchmark.py points.in
+    python benchmark.py --points 1000000 --distribution disk
+    python benchmark.py --points 1000000 --distribution parabola   # every point a hull vertex
+    python benchmark.py --points 2000 --check   # compare with main.py after every insertion
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import random
+import sys
+import time
+
+from online_hull import OnlineConvexHull, Point
+
+
+def main() -> int:
+    args = _parse_args()
+    if args.input:
+        points = _load_points(args.input)
+    else:
+        points = _generate_points(args.points, args.distribution, args.seed)
+
+    print(f'{len(points)} points')
+    hull = benchmark_inserts(points)
+    benchmark_queries(hull, points, args.seed)
+    if args.check:
+        check_against_batch(points)
+
+    return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', nargs='?', help='points in the lab input format')
+    parser.add_argument('--points', type=int, default=100_000)
+    parser.add_argument('--distribution', choices=('square', 'disk', 'circle', 'parabola'), default='square')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check', action='store_true', help='compare with the batch engine after every insertion')
+    return parser.parse_args()
+
+
+def benchmark_inserts(points: list[Point]) -> OnlineConvexHull:
+    hull = OnlineConvexHull()
+    n_rejected = 0
+
+    start = time.perf_counter_ns()
+    for point in points:
+        if not hull.insert(point):
+            n_rejected += 1
+    elapsed_s = (time.perf_counter_ns() - start) / 1e9
+
+    print(f'insert: {len(points) / elapsed_s:,.0f} points/s ({n_rejected} rejected as interior), {len(hull)} vertices')
+    return hull
+
+
+def benchmark_queries(hull: OnlineConvexHull, points: list[Point], seed: int) -> None:
+    rng = random.Random(seed + 1)
+    queries = [rng.choice(points) for _ in range(min(len(points), 100_000))]
+    queries = [(x + rng.uniform(-1, 1), y + rng.uniform(-1, 1)) for x, y in queries]
+
+    start = time.perf_counter_ns()
+    for query in queries:
+        _ = query in hull
+    elapsed_s = (time.perf_counter_ns() - start) / 1e9
+    print(f'point-in-hull: {len(queries) / elapsed_s:,.0f} queries/s')
+
+    start = time.perf_counter_ns()
+    for _ in range(len(queries)):
+        len(hull)
+        hull.area()
+    elapsed_s = (time.perf_counter_ns() - start) / 1e9
+    print(f'size and area: {len(queries) / elapsed_s:,.0f} queries/s')
+
+
+def check_against_batch(points: list[Point]) -> None:
+    """Compare the hull vertices with `main._find_convex_hull` after every insertion."""
+    import main as batch
+
+    # the batch engine logs every step
+    logging.disable(logging.CRITICAL)
+
+    hull = OnlineConvexHull()
+    for n_points, point in enumerate(points, start=1):
+        hull.insert(point)
+        vertices = hull.vertices()
+        if len(vertices) < 3:
+            # the Graham scan needs three non-collinear points
+            continue
+
+        coordinates = [batch.Coordinate(x, y, ...) for x, y in points[:n_points]]
+        expected = batch._find_convex_hull(n_points, coordinates)
+        expected = {(coordinate.x + batch.min_x, coordinate.y + batch.min_y) for coordinate in expected}
+        if set(vertices) != expected:
+            raise AssertionError(f'hull differs after {n_points} points: {vertices} != {sorted(expected)}')
+
+    print(f'batch check: hulls agree after all {len(points)} insertions')
+
+
+def _load_points(path: str) -> list[Point]:
+    """Read points in the same format as `main.parse_input`."""
+    with open(path) as file:
+        _, n_points = [int(entry) for entry in file.readline().split(' ')]
+        points = []
+        for _ in range(n_points):
+            x, y = [float(coordinate) for coordinate in file.readline().split('#')[1].strip().split(' ')]
+            points.append((x, y))
+    return points
+
+
+def _generate_points(n_points: int, distribution: str, seed: int) -> list[Point]:
+    """Integer points in a square, in a disk, close to a circle, or on a parabola.
+
+    Most points close to a circle end up on the hull. The parabola points (x, x²) come
+    in random order, and every one of them is a hull vertex when inserted.
+    """
+    rng = random.Random(seed)
+    if distribution == 'parabola':
+        xs = list(range(-(n_points // 2), n_points - n_points // 2))
+        rng.shuffle(xs)
+        return [(x, x * x) for x in xs]
+
+    radius = 10**6
+    points = []
+    while len(points) < n_points:
+        x, y = rng.randint(-radius, radius), rng.randint(-radius, radius)
+        if distribution == 'square':
+            points.append((x, y))
+        elif distribution == 'disk' and x * x + y * y <= radius * radius:
+            points.append((x, y))
+        elif distribution == 'circle':
+            angle = rng.uniform(0, 2 * math.pi)
+            points.append((round(radius * math.cos(angle)), round(radius * math.sin(angle))))
+    return points
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,15 @@
 import logging
+import pathlib
+import sys
 from dataclasses import dataclass
 from collections import abc
 
 import numpy as np
 
+# the shared instrumentation lives at the repository root
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from edaf05_profiling import profiled  # noqa: E402
+
 # quick and dirty solution for keeping these values
 min_x = 0.0
 min_y = 0.0
@@ -19,11 +25,15 @@ class Coordinate:
 
 
 def main() -> None:
-    dim, n_points, coordinates = parse_input()
+    with profiled('4convexhull') as profiler:
+        with profiler.phase('parse'):
+            dim, n_points, coordinates = parse_input()
 
-    convex_hull = _find_convex_hull(n_points, coordinates)
+        with profiler.phase('solve'):
+            convex_hull = _find_convex_hull(n_points, coordinates)
 
-    _display_output(convex_hull)
+        with profiler.phase('output'):
+            _display_output(convex_hull)
 
 
 def parse_input() -> tuple[int, int, list[Coordinate]]:
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+from collections import abc
+
+Point = tuple[float, float]
+
+
+class OnlineConvexHull:
+    """Convex hull of a growing point set, updated one insertion at a time.
+
+    The hull is kept as a lower and an upper chain, each a sequence of vertices sorted
+    by x. The upper chain is stored mirrored through the origin, which turns it into a
+    lower chain, so both are handled by the same code. Locating a point is a binary
+    search followed by one cross product, so interior points are rejected in
+    O(log n); a point on the hull removes the vertices it hides, which each happen
+    at most once. Size and area are maintained incrementally and cost O(1) to query.
+
+    Like the batch Graham scan in `main.py`, only strict corners are kept: points
+    on a hull edge are not vertices.
+    """
+
+    def __init__(self, points: abc.Iterable[Point] = ()) -> None:
+        self._lower = _Chain()
+        self._upper = _Chain()  # mirrored: stores (-x, -y)
+        for point in points:
+            self.insert(point)
+
+    def insert(self, point: Point) -> bool:
+        """Insert a point; return False if it was inside (or on) the current hull."""
+        x, y = point
+        # `|`, not `or`: a new extreme point may extend both chains
+        return self._lower.insert(x, y) | self._upper.insert(-x, -y)
+
+    def __contains__(self, point: Point) -> bool:
+        """Whether the point lies inside or on the boundary of the hull."""
+        x, y = point
+        return self._lower.covers(x, y) and self._upper.covers(-x, -y)
+
+    def __len__(self) -> int:
+        """Number of hull vertices."""
+        if not self._lower:
+            return 0
+
+        return len(self._lower) + len(self._upper) - self._n_shared_endpoints()
+
+    def vertices(self) -> list[Point]:
+        """Hull vertices in counterclockwise order, starting at the lowest leftmost point."""
+        lower = list(self._lower)
+        upper = [(-x, -y) for x, y in self._upper]  # rightmost first
+
+        if upper and lower and upper[0] == lower[-1]:
+            upper = upper[1:]
+        if upper and lower and upper[-1] == lower[0]:
+            upper = upper[:-1]
+
+        return lower + upper
+
+    def area(self) -> float:
+        """Area enclosed by the hull (shoelace formula)."""
+        if not self._lower:
+            return 0.0
+
+        # the mirrored upper chain runs right to left, which is counterclockwise order,
+        # and mirroring both endpoints leaves each cross term unchanged
+        rightmost, leftmost = _mirror(self._upper.first()), _mirror(self._upper.last())
+        twice_area = (
+            self._lower.twice_area
+            + self._upper.twice_area
+            + _cross_term(self._lower.last(), rightmost)
+            + _cross_term(leftmost, self._lower.first())
+        )
+        return abs(twice_area) / 2
+
+    def _n_shared_endpoints(self) -> int:
+        """Vertices that appear as an endpoint of both chains."""
+        rightmost, leftmost = _mirror(self._upper.first()), _mirror(self._upper.last())
+
+        if len(self._lower) == 1:
+            # all points share one x; the chains are its lowest and highest point
+            return int(rightmost == self._lower.first())
+
+        return (rightmost == self._lower.last()) + (leftmost == self._lower.first())
+
+
+# a chain block is split when it grows beyond twice this size, and merged with a
+# neighbour when it shrinks below half of it
+_BLOCK_SIZE = 512
+
+# (block, offset) in a chain; the offset may be one past the end of the last block
+_Position = tuple[int, int]
+
+
+class _Chain:
+    """Lower convex chain: vertices sorted by x, turning strictly counterclockwise.
+
+    The vertices are stored as a list of sorted blocks of bounded size, like a B+-tree
+    with a single level of inner nodes: a binary search over the first x of every block
+    and another inside one block locate a point, and an insertion or deletion only
+    shifts the vertices of its own block. A plain list would move every later vertex,
+    which makes hulls with many vertices (points on a circle or parabola) quadratic.
+    """
+
+    def __init__(self) -> None:
+        self._blocks: list[list[Point]] = []
+        self._first_xs: list[float] = []
+        self._n_points = 0
+        # sum of cross terms between consecutive vertices, for the shoelace formula
+        self.twice_area = 0.0
+
+    def __len__(self) -> int:
+        return self._n_points
+
+    def __iter__(self) -> abc.Iterator[Point]:
+        return itertools.chain.from_iterable(self._blocks)
+
+    def first(self) -> Point:
+        return self._blocks[0][0]
+
+    def last(self) -> Point:
+        return self._blocks[-1][-1]
+
+    def covers(self, x: float, y: float) -> bool:
+        """Whether (x, y) lies on or above the chain, within its x range."""
+        if not self._blocks:
+            return False
+
+        position = self._locate(x)
+        point = self._at(position)
+        if point is not None and point[0] == x:
+            return point[1] <= y
+        if point is None or (previous := self._previous(position)) is None:
+            return False
+
+        return _cross(self._at(previous), point, (x, y)) >= 0
+
+    def insert(self, x: float, y: float) -> bool:
+        """Insert (x, y) if it lies below the chain; return whether the chain changed."""
+        if self.covers(x, y):
+            return False
+
+        point = (x, y)
+        position = self._locate(x)
+        # a lower point with the same x replaces the old vertex
+        if (old := self._at(position)) is not None and old[0] == x:
+            self._delete(position)
+            position = self._locate(x)
+        self._insert(position, point)
+
+        # drop vertices that no longer make a strict left turn, on both sides; a
+        # deletion may merge blocks, so the new vertex is located again after each
+        position = self._locate(x)
+        while (
+            (after := self._next(position)) is not None
+            and (after_2 := self._next(after)) is not None
+            and _cross(point, self._at(after), self._at(after_2)) <= 0
+        ):
+            self._delete(after)
+            position = self._locate(x)
+        while (
+            (before := self._previous(position)) is not None
+            and (before_2 := self._previous(before)) is not None
+            and _cross(self._at(before_2), self._at(before), point) <= 0
+        ):
+            self._delete(before)
+            position = self._locate(x)
+
+        return True
+
+    def _locate(self, x: float) -> _Position:
+        """Position of the first vertex with an x of at least `x`, or the end."""
+        if not self._blocks:
+            return 0, 0
+
+        block = max(0, bisect.bisect_right(self._first_xs, x) - 1)
+        offset = bisect.bisect_left(self._blocks[block], (x, float('-inf')))
+        if offset == len(self._blocks[block]) and block + 1 < len(self._blocks):
+            return block + 1, 0
+        return block, offset
+
+    def _at(self, position: _Position) -> Point | None:
+        """Vertex at a position, or None at the end."""
+        block, offset = position
+        if block < len(self._blocks) and offset < len(self._blocks[block]):
+            return self._blocks[block][offset]
+        return None
+
+    def _next(self, position: _Position) -> _Position | None:
+        block, offset = position
+        if offset + 1 < len(self._blocks[block]):
+            return block, offset + 1
+        if block + 1 < len(self._blocks):
+            return block + 1, 0
+        return None
+
+    def _previous(self, position: _Position) -> _Position | None:
+        block, offset = position
+        if offset:
+            return block, offset - 1
+        if block:
+            return block - 1, len(self._blocks[block - 1]) - 1
+        return None
+
+    def _insert(self, position: _Position, point: Point) -> None:
+        """Insert a vertex before `position`; invalidates all positions."""
+        if not self._blocks:
+            self._blocks.append([point])
+            self._first_xs.append(point[0])
+            self._n_points = 1
+            return
+
+        previous = self._previous(position)
+        before = self._at(previous) if previous is not None else None
+        after = self._at(position)
+        if before is not None:
+            self.twice_area += _cross_term(before, point)
+        if after is not None:
+            self.twice_area += _cross_term(point, after)
+        if before is not None and after is not None:
+            self.twice_area -= _cross_term(before, after)
+
+        block, offset = position
+        self._blocks[block].insert(offset, point)
+        if not offset:
+            self._first_xs[block] = point[0]
+        self._n_points += 1
+        if len(self._blocks[block]) > 2 * _BLOCK_SIZE:
+            self._split(block)
+
+    def _delete(self, position: _Position) -> None:
+        """Delete the vertex at `position`; invalidates all positions."""
+        previous, following = self._previous(position), self._next(position)
+        before = self._at(previous) if previous is not None else None
+        after = self._at(following) if following is not None else None
+        block, offset = position
+        point = self._blocks[block].pop(offset)
+        self._n_points -= 1
+
+        if before is not None:
+            self.twice_area -= _cross_term(before, point)
+        if after is not None:
+            self.twice_area -= _cross_term(point, after)
+        if before is not None and after is not None:
+            self.twice_area += _cross_term(before, after)
+
+        if not self._blocks[block]:
+            del self._blocks[block]
+            del self._first_xs[block]
+            return
+        if not offset:
+            self._first_xs[block] = self._blocks[block][0][0]
+        if len(self._blocks[block]) < _BLOCK_SIZE // 2 and len(self._blocks) > 1:
+            self._merge(block - 1 if block else block)
+
+    def _split(self, block: int) -> None:
+        """Split a block in two halves."""
+        points = self._blocks[block]
+        half = len(points) // 2
+        self._blocks[block:block + 1] = [points[:half], points[half:]]
+        self._first_xs.insert(block + 1, points[half][0])
+
+    def _merge(self, block: int) -> None:
+        """Merge a block with the next one, splitting the result again if it is too large."""
+        self._blocks[block] += self._blocks.pop(block + 1)
+        del self._first_xs[block + 1]
+        if len(self._blocks[block]) > 2 * _BLOCK_SIZE:
+            self._split(block)
+
+
+def _cross(origin: Point, point_1: Point, point_2: Point) -> float:
+    """Cross product of origin->point_1 and origin->point_2; positive for a left turn."""
+    return (
+        (point_1[0] - origin[0]) * (point_2[1] - origin[1])
+        - (point_1[1] - origin[1]) * (point_2[0] - origin[0])
+    )
+
+
+def _cross_term(point_1: Point, point_2: Point) -> float:
+    return point_1[0] * point_2[1] - point_2[0] * point_1[1]
+
+
+def _mirror(point: Point) -> Point:
+    return -point[0], -point[1]
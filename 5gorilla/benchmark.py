@@ -0,0 +1,90 @@
+"""Full versus banded alignment across similarity levels.
+
+Pairs are made by mutating a random word with the given share of substitutions,
+insertions and deletions, scored with the substitution matrix of an input file.
+Run from this directory:
+
+    python benchmark.py
+    python benchmark.py --length 3000 --mutation-rates 0.01 0.05 0.2 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from main import GAP, GAP_PENALTY, Scores, align, align_banded
+
+
+def main() -> int:
+    args = _parse_args()
+    scores = _load_scores(args.matrix)
+    rng = random.Random(args.seed)
+
+    print(f'{"mutation rate":>13} {"full ms":>10} {"banded ms":>10} {"speedup":>8}')
+    for mutation_rate in args.mutation_rates:
+        word_1 = ''.join(rng.choice(list(scores)) for _ in range(args.length))
+        word_2 = _mutate(word_1, mutation_rate, list(scores), rng)
+
+        full_ms, full = _time_ms(align, word_1, word_2, scores)
+        banded_ms, banded = _time_ms(align_banded, word_1, word_2, scores)
+        if score(*full, scores) != score(*banded, scores):
+            raise AssertionError(f'banded score {score(*banded, scores)} != {score(*full, scores)}')
+
+        print(f'{mutation_rate:>13.3f} {full_ms:>10.1f} {banded_ms:>10.1f} {full_ms / banded_ms:>8.1f}')
+
+    return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--matrix', default='data/secret/4huge.in', help='input file to take the substitution matrix from')
+    parser.add_argument('--length', type=int, default=1000)
+    parser.add_argument('--mutation-rates', type=float, nargs='+', default=[0.0, 0.01, 0.05, 0.1, 0.2, 0.4])
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+
+def score(aligned_1: str, aligned_2: str, scores: Scores) -> int:
+    """Score of an alignment, as computed by `output_validator.py`."""
+    return sum(
+        GAP_PENALTY if GAP in (char_1, char_2) else scores[char_1][char_2]
+        for char_1, char_2 in zip(aligned_1, aligned_2)
+    )
+
+
+def _time_ms(align_pair, word_1: str, word_2: str, scores: Scores):
+    start = time.perf_counter_ns()
+    alignment = align_pair(word_1, word_2, scores)
+    return (time.perf_counter_ns() - start) / 1e6, alignment
+
+
+def _mutate(word: str, mutation_rate: float, characters: list[str], rng: random.Random) -> str:
+    """Substitute, insert or delete (equally likely) at each position with the given probability."""
+    mutated = []
+    for char in word:
+        if rng.random() >= mutation_rate:
+            mutated.append(char)
+            continue
+
+        operation = rng.randrange(3)
+        if operation == 0:
+            mutated.append(rng.choice(characters))
+        elif operation == 1:
+            mutated.extend((char, rng.choice(characters)))
+        # otherwise the character is deleted
+    return ''.join(mutated)
+
+
+def _load_scores(path: str) -> Scores:
+    with open(path) as file:
+        characters = file.readline().split()
+        return {
+            character: dict(zip(characters, (int(score) for score in file.readline().split())))
+            for character in characters
+        }
+
+
+if __name__ == '__main__':
+    sys.exit(main())
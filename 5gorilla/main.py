@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import pathlib
+import sys
+from collections import abc
+
+# the shared instrumentation lives at the repository root
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from edaf05_profiling import profiled  # noqa: E402
+
+GAP = '*'
+GAP_PENALTY = -4
+BANDED_FLAG = '--banded'
+# band half-width to start from before doubling
+INITIAL_BAND = 8
+
+Scores = dict[str, dict[str, int]]
+
+
+def main() -> int:
+    with profiled('5gorilla') as profiler:
+        banded = BANDED_FLAG in sys.argv[1:]
+        align_pair = align_banded if banded else align
+
+        with profiler.phase('parse'):
+            scores, word_pairs = _parse_input()
+
+        with profiler.phase('solve'):
+            alignments = [align_pair(word_1, word_2, scores) for word_1, word_2 in word_pairs]
+
+        with profiler.phase('output'):
+            _display_output(alignments)
+
+    return 0
+
+
+def _parse_input() -> tuple[Scores, list[tuple[str, str]]]:
+    """Parse the substitution matrix and the word pairs to align."""
+    characters = input().split()
+    scores: Scores = {}
+    for character in characters:
+        row = [int(score) for score in input().split()]
+        scores[character] = dict(zip(characters, row))
+
+    n_pairs = int(input())
+    word_pairs = []
+    for _ in range(n_pairs):
+        word_1, word_2 = input().split()
+        word_pairs.append((word_1, word_2))
+
+    return scores, word_pairs
+
+
+def align(word_1: str, word_2: str, scores: Scores) -> tuple[str, str]:
+    """Find an optimal alignment by filling the full (n + 1) x (m + 1) table."""
+    n, m = len(word_1), len(word_2)
+
+    # opt[i][j] is the best score of aligning word_1[:i] with word_2[:j]
+    opt = [[j * GAP_PENALTY for j in range(m + 1)]]
+    for i in range(1, n + 1):
+        row_scores = scores[word_1[i - 1]]
+        previous = opt[-1]
+        row = [i * GAP_PENALTY]
+        for j in range(1, m + 1):
+            row.append(max(
+                previous[j - 1] + row_scores[word_2[j - 1]],
+                previous[j] + GAP_PENALTY,
+                row[j - 1] + GAP_PENALTY,
+            ))
+        opt.append(row)
+
+    return _trace_back(word_1, word_2, scores, lambda i, j: opt[i][j])
+
+
+def align_banded(word_1: str, word_2: str, scores: Scores) -> tuple[str, str]:
+    """Find an optimal alignment using only cells close to the main diagonal.
+
+    Only cells with |i - j| <= k are filled, in O(k * n) time and memory. An
+    alignment that leaves the band needs at least 2(k + 1) - |n - m| gaps of
+    penalty -4, which bounds its score given the largest substitution scores of
+    the characters; while the banded score is below that bound, k is doubled.
+    Once the band would cover half the table, the full table is filled instead.
+    """
+    n, m = len(word_1), len(word_2)
+    bounds = _bounds_by_substitutions(word_1, word_2, scores)
+
+    band = max(abs(n - m), INITIAL_BAND)
+    while True:
+        if 2 * band + 1 >= max(n, m) / 2:
+            # the band would cover most of the table; the full table is cheaper per cell
+            return align(word_1, word_2, scores)
+
+        rows = _fill_band(word_1, word_2, scores, band)
+        score = rows[n][m - max(0, n - band)]
+        if score >= _bound_outside_band(n, m, band, bounds):
+            break
+        band *= 2
+
+    def opt_at(i: int, j: int) -> int | float:
+        low = max(0, i - band)
+        if low <= j <= min(m, i + band):
+            return rows[i][j - low]
+        return float('-inf')
+
+    return _trace_back(word_1, word_2, scores, opt_at)
+
+
+def _fill_band(word_1: str, word_2: str, scores: Scores, band: int) -> list[list[int | float]]:
+    """Fill the band |i - j| <= band; row i holds columns max(0, i - band)..min(m, i + band)."""
+    n, m = len(word_1), len(word_2)
+    rows: list[list[int | float]] = [[j * GAP_PENALTY for j in range(min(m, band) + 1)]]
+
+    for i in range(1, n + 1):
+        row_scores = scores[word_1[i - 1]]
+        previous = rows[-1]
+        previous_low = max(0, i - 1 - band)
+        low, high = max(0, i - band), min(m, i + band)
+
+        row: list[int | float] = []
+        left: int | float = float('-inf')
+        if low == 0:
+            left = i * GAP_PENALTY
+            row.append(left)
+
+        # the cell above is inside the band for all but the last column of the row
+        above_high = min(high, i - 1 + band)
+        for j in range(max(low, 1), above_high + 1):
+            best = previous[j - 1 - previous_low] + row_scores[word_2[j - 1]]
+            if (above := previous[j - previous_low] + GAP_PENALTY) > best:
+                best = above
+            if (from_left := left + GAP_PENALTY) > best:
+                best = from_left
+            row.append(best)
+            left = best
+
+        if high > above_high:
+            row.append(max(
+                previous[high - 1 - previous_low] + row_scores[word_2[high - 1]],
+                left + GAP_PENALTY,
+            ))
+        rows.append(row)
+
+    return rows
+
+
+def _bounds_by_substitutions(word_1: str, word_2: str, scores: Scores) -> list[int]:
+    """Upper bounds on the score of any alignment with at most p substitutions, for each p.
+
+    Each character can score at most the best entry of its row (or column) of the
+    substitution matrix, so p substitutions score at most the p largest of these
+    over either word, and the remaining n + m - 2p characters are gaps.
+    """
+    n, m = len(word_1), len(word_2)
+    best_in_row = {char: max(row.values()) for char, row in scores.items()}
+    best_in_column = {char: max(row[char] for row in scores.values()) for char in scores}
+    best_1 = sorted((best_in_row[char] for char in word_1), reverse=True)
+    best_2 = sorted((best_in_column[char] for char in word_2), reverse=True)
+
+    bounds = [(n + m) * GAP_PENALTY]
+    sum_1 = sum_2 = 0
+    for n_substitutions in range(1, min(n, m) + 1):
+        sum_1 += best_1[n_substitutions - 1]
+        sum_2 += best_2[n_substitutions - 1]
+        bound = min(sum_1, sum_2) + (n + m - 2 * n_substitutions) * GAP_PENALTY
+        # at most p substitutions, so keep the running maximum
+        bounds.append(max(bound, bounds[-1]))
+
+    return bounds
+
+
+def _bound_outside_band(n: int, m: int, band: int, bounds: list[int]) -> int | float:
+    """Upper bound on the score of any alignment with a cell outside the band."""
+    # leaving the band and returning to cell (n, m) takes this many gaps
+    min_gaps = 2 * (band + 1) - abs(n - m)
+    if min_gaps > n + m:
+        return float('-inf')
+
+    max_substitutions = min(n, m, (n + m - min_gaps) // 2)
+    return bounds[max_substitutions]
+
+
+def _trace_back(
+    word_1: str,
+    word_2: str,
+    scores: Scores,
+    opt_at: abc.Callable[[int, int], int | float],
+) -> tuple[str, str]:
+    """Recover an alignment from the filled table, from the last cell to the first."""
+    aligned_1: list[str] = []
+    aligned_2: list[str] = []
+    i, j = len(word_1), len(word_2)
+
+    while i or j:
+        current = opt_at(i, j)
+        if i and j and current == opt_at(i - 1, j - 1) + scores[word_1[i - 1]][word_2[j - 1]]:
+            i, j = i - 1, j - 1
+            aligned_1.append(word_1[i])
+            aligned_2.append(word_2[j])
+        elif i and current == opt_at(i - 1, j) + GAP_PENALTY:
+            i -= 1
+            aligned_1.append(word_1[i])
+            aligned_2.append(GAP)
+        else:
+            j -= 1
+            aligned_1.append(GAP)
+            aligned_2.append(word_2[j])
+
+    return ''.join(reversed(aligned_1)), ''.join(reversed(aligned_2))
+
+
+def _display_output(alignments: list[tuple[str, str]]) -> None:
+    for aligned_1, aligned_2 in alignments:
+        print(aligned_1, aligned_2)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Per-removal latency of the incremental max-flow, checked against recomputing from scratch.
+
+All planned removals of an input file are applied in order. After each one the
+incremental flow value is compared with a maximum flow computed from scratch on the
+remaining routes, and with the capacity of the reported minimum cut. Run from this
+directory:
+
+    python benchmark.py data/secret/3large.in
+    python benchmark.py data/secret/4huge.in --check-every 100 --latencies latencies.csv
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+
+from incremental_flow import IncrementalMaxFlow
+
+Route = tuple[int, int, int]
+
+
+def main() -> int:
+    args = _parse_args()
+    n_nodes, routes, removals = _load_input(args.input)
+
+    network = _build_network(n_nodes, routes)
+    start = time.perf_counter_ns()
+    network.maximize()
+    print(f'initial max flow {network.value} in {(time.perf_counter_ns() - start) / 1e6:.1f} ms')
+
+    # (step, route, whether the route carried flow, latency)
+    records: list[tuple[int, int, bool, int]] = []
+    scratch_ns = []
+    removed = set()
+    for step, route in enumerate(removals, start=1):
+        had_flow = network.flow(route) != 0
+        start = time.perf_counter_ns()
+        flow = network.remove_edge(route)
+        records.append((step, route, had_flow, time.perf_counter_ns() - start))
+        removed.add(route)
+
+        if step % args.check_every and step != len(removals):
+            continue
+
+        cut = network.min_cut()
+        start = time.perf_counter_ns()
+        expected = _build_network(n_nodes, routes, removed).maximize()
+        scratch_ns.append(time.perf_counter_ns() - start)
+        if not flow == cut.capacity == expected:
+            raise AssertionError(f'step {step}: incremental {flow}, min cut {cut.capacity}, from scratch {expected}')
+
+    print(f'{len(removals)} removals, {len(scratch_ns)} checked against a from-scratch max flow')
+    _print_latencies('removals with flow', [latency for *_, had_flow, latency in records if had_flow])
+    _print_latencies('removals without flow', [latency for *_, had_flow, latency in records if not had_flow])
+    _print_latencies('from scratch', scratch_ns)
+
+    if args.latencies:
+        with open(args.latencies, 'w') as file:
+            file.write('step,route,had_flow,latency_ns\n')
+            for step, route, had_flow, latency in records:
+                file.write(f'{step},{route},{int(had_flow)},{latency}\n')
+
+    return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('input', help='network in the lab input format')
+    parser.add_argument('--check-every', type=int, default=1, help='removals between from-scratch comparisons')
+    parser.add_argument('--latencies', help='write the latency of every removal to this CSV file')
+    return parser.parse_args()
+
+
+def _print_latencies(label: str, latencies_ns: list[int]) -> None:
+    if not latencies_ns:
+        print(f'{label}: none')
+        return
+
+    latencies_us = sorted(latency / 1e3 for latency in latencies_ns)
+    p99 = latencies_us[min(len(latencies_us) - 1, int(0.99 * len(latencies_us)))]
+    print(
+        f'{label}: {len(latencies_us)}, mean {statistics.fmean(latencies_us):.1f} us, '
+        f'median {statistics.median(latencies_us):.1f} us, p99 {p99:.1f} us, max {latencies_us[-1]:.1f} us'
+    )
+
+
+def _build_network(n_nodes: int, routes: list[Route], removed: set[int] = frozenset()) -> IncrementalMaxFlow:
+    """Network of the routes; removed routes keep their identifier but get no capacity."""
+    network = IncrementalMaxFlow(n_nodes, source=0, sink=n_nodes - 1)
+    for route, (node_1, node_2, capacity) in enumerate(routes):
+        network.add_edge(node_1, node_2, 0 if route in removed else capacity)
+    return network
+
+
+def _load_input(path: str) -> tuple[int, list[Route], list[int]]:
+    with open(path) as file:
+        n_nodes, n_routes, _, n_removals = [int(nbr) for nbr in file.readline().split()]
+        routes = [tuple(int(nbr) for nbr in file.readline().split()) for _ in range(n_routes)]
+        removals = [int(file.readline()) for _ in range(n_removals)]
+    return n_nodes, routes, removals
+
+
+if __name__ == '__main__':
+    sys.exit(main())
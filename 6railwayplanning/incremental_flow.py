@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import collections
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class MinCut:
+    source_side: set[int]
+    edges: list[int]  # identifiers of the edges crossing the cut
+    capacity: int
+
+
+class IncrementalMaxFlow:
+    """Maximum flow in an undirected network that edges are removed from one at a time.
+
+    Edge e joins `tail[e]` and `head[e]` and carries `flow[e]` in the direction tail
+    to head (negative flow runs the other way), so the residual capacity from tail to
+    head is `capacity - flow` and from head to tail `capacity + flow`.
+
+    Removing an edge without flow leaves the flow both feasible and maximal, so it is
+    O(1). Otherwise the flow on the edge leaves an excess at one endpoint and a
+    deficit at the other; this is repaired by rerouting between the endpoints, then
+    cancelling what is left back towards the source and sink, and finally
+    augmenting again from the repaired flow.
+
+    Augmenting paths never enter the source or leave the sink, and the repair keeps
+    it that way, so the flow value is always the net flow out of the source.
+    """
+
+    def __init__(self, n_nodes: int, source: int, sink: int) -> None:
+        self.source = source
+        self.sink = sink
+        self.value = 0
+        self._tail: list[int] = []
+        self._head: list[int] = []
+        self._capacity: list[int] = []
+        self._flow: list[int] = []
+        self._edges_at: list[list[int]] = [[] for _ in range(n_nodes)]
+        self._min_cut: MinCut | None = None
+
+    def add_edge(self, node_1: int, node_2: int, capacity: int) -> int:
+        """Add an undirected edge and return its identifier; call `maximize` afterwards."""
+        edge = len(self._capacity)
+        self._tail.append(node_1)
+        self._head.append(node_2)
+        self._capacity.append(capacity)
+        self._flow.append(0)
+        self._edges_at[node_1].append(edge)
+        self._edges_at[node_2].append(edge)
+        self._min_cut = None
+        return edge
+
+    def flow(self, edge: int) -> int:
+        return self._flow[edge]
+
+    def maximize(self) -> int:
+        """Augment the current flow to a maximum flow (Dinic) and return its value."""
+        while (level := self._levels()) is not None:
+            pointer = [0] * len(self._edges_at)
+            while pushed := self._push_blocking_path(level, pointer):
+                self.value += pushed
+        self._min_cut = None
+        return self.value
+
+    def remove_edge(self, edge: int) -> int:
+        """Remove an edge, repair the flow, and return the new maximum flow value."""
+        flow = self._flow[edge]
+        self._capacity[edge] = 0
+        self._min_cut = None
+        if not flow:
+            return self.value
+
+        self._flow[edge] = 0
+        # the flow that used to leave `excess` through the edge is now stuck there
+        excess, deficit = (self._tail[edge], self._head[edge]) if flow > 0 else (self._head[edge], self._tail[edge])
+        amount = abs(flow)
+
+        # reroute around the removed edge, which keeps the flow value
+        amount -= self._push_paths(excess, {deficit}, amount)
+        if amount:
+            # cancel the rest: the excess drains back to the source (or on to the
+            # sink), and the deficit is taken back from the sink (or the source)
+            terminals = {self.source, self.sink}
+            if excess == self.source:
+                self.value -= amount
+            elif self._push_paths(excess, terminals, amount) != amount:
+                raise RuntimeError(f'could not drain the excess after removing edge {edge}')
+            if deficit != self.sink and self._push_paths(deficit, terminals, amount, reverse=True) != amount:
+                raise RuntimeError(f'could not fill the deficit after removing edge {edge}')
+
+        return self.maximize()
+
+    def min_cut(self) -> MinCut:
+        """Minimum cut of the current (maximum) flow: what the source still reaches."""
+        if self._min_cut is not None:
+            return self._min_cut
+
+        source_side = {self.source}
+        queue = collections.deque([self.source])
+        while queue:
+            node = queue.popleft()
+            for edge in self._edges_at[node]:
+                other, residual = self._residual(edge, node)
+                if residual > 0 and other not in source_side:
+                    source_side.add(other)
+                    queue.append(other)
+
+        edges = [
+            edge for edge in range(len(self._capacity))
+            if self._capacity[edge] and (self._tail[edge] in source_side) != (self._head[edge] in source_side)
+        ]
+        capacity = sum(self._capacity[edge] for edge in edges)
+        self._min_cut = MinCut(source_side, edges, capacity)
+        return self._min_cut
+
+    def _residual(self, edge: int, node: int) -> tuple[int, int]:
+        """Other endpoint of an edge and its residual capacity leaving `node`."""
+        if node == self._tail[edge]:
+            return self._head[edge], self._capacity[edge] - self._flow[edge]
+        return self._tail[edge], self._capacity[edge] + self._flow[edge]
+
+    def _send(self, edge: int, node: int, amount: int) -> None:
+        """Send flow along an edge, away from `node`."""
+        if node == self._tail[edge]:
+            self._flow[edge] += amount
+        else:
+            self._flow[edge] -= amount
+
+    def _levels(self) -> list[int] | None:
+        """BFS distances from the source in the residual graph, or None if the sink is cut off."""
+        level = [-1] * len(self._edges_at)
+        level[self.source] = 0
+        queue = collections.deque([self.source])
+        while queue:
+            node = queue.popleft()
+            if node == self.sink:
+                continue
+            for edge in self._edges_at[node]:
+                other, residual = self._residual(edge, node)
+                if residual > 0 and level[other] < 0:
+                    level[other] = level[node] + 1
+                    queue.append(other)
+
+        return level if level[self.sink] >= 0 else None
+
+    def _push_blocking_path(self, level: list[int], pointer: list[int]) -> int:
+        """Push flow along one source-sink path of increasing level; 0 once blocked."""
+        path: list[tuple[int, int]] = []  # (edge, node the edge is left from)
+        node = self.source
+        while node != self.sink:
+            edges = self._edges_at[node]
+            while pointer[node] < len(edges):
+                edge = edges[pointer[node]]
+                other, residual = self._residual(edge, node)
+                if residual > 0 and level[other] == level[node] + 1:
+                    break
+                pointer[node] += 1
+            else:
+                # dead end: retreat and skip the edge that led here
+                if not path:
+                    return 0
+                level[node] = -1
+                _, node = path.pop()
+                pointer[node] += 1
+                continue
+
+            path.append((edge, node))
+            node = other
+
+        amount = min(self._residual(edge, node)[1] for edge, node in path)
+        for edge, node in path:
+            self._send(edge, node, amount)
+        return amount
+
+    def _push_paths(self, start: int, targets: set[int], limit: int, reverse: bool = False) -> int:
+        """Push up to `limit` along shortest residual paths from start to any target.
+
+        With `reverse`, flow is pushed from a target to start instead. Paths never
+        pass through the source or sink, only end there. Returns the amount pushed.
+        """
+        pushed = 0
+        while pushed < limit:
+            found = self._find_path(start, targets, reverse)
+            if found is None:
+                break
+
+            path, end = found
+            amount = min(limit - pushed, min(residual for _, _, residual in path))
+            for edge, node, _ in path:
+                self._send(edge, node, amount)
+            pushed += amount
+            if end == self.source:
+                self.value += amount if reverse else -amount
+
+        return pushed
+
+    def _find_path(
+        self,
+        start: int,
+        targets: set[int],
+        reverse: bool,
+    ) -> tuple[list[tuple[int, int, int]], int] | None:
+        """BFS for a residual path, as (edge, node flow leaves through, residual) triples and its end."""
+        terminals = {self.source, self.sink}
+        # node -> (edge it was reached through, previous node, residual of that edge)
+        predecessor: dict[int, tuple[int, int, int]] = {start: (-1, -1, 0)}
+        queue = collections.deque([start])
+        while queue:
+            node = queue.popleft()
+            for edge in self._edges_at[node]:
+                other, residual = self._residual(edge, node)
+                if reverse:
+                    # flow has to be able to come into node from other
+                    residual = self._residual(edge, other)[1]
+                if other == (self.sink if reverse else self.source):
+                    # only cancel flow here, so that no flow enters the source or leaves the sink
+                    residual -= self._capacity[edge]
+                if residual <= 0 or other in predecessor:
+                    continue
+
+                predecessor[other] = (edge, node, residual)
+                if other in targets:
+                    return self._trace_path(predecessor, other, reverse), other
+                if other not in terminals:
+                    queue.append(other)
+
+        return None
+
+    @staticmethod
+    def _trace_path(
+        predecessor: dict[int, tuple[int, int, int]],
+        end: int,
+        reverse: bool,
+    ) -> list[tuple[int, int, int]]:
+        path = []
+        node = end
+        while predecessor[node][0] >= 0:
+            edge, previous, residual = predecessor[node]
+            # flow runs previous -> node, or node -> previous when pushing in reverse
+            path.append((edge, node if reverse else previous, residual))
+            node = previous
+        return path
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pathlib
+import sys
+
+from incremental_flow import IncrementalMaxFlow
+
+# the shared instrumentation lives at the repository root
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+from edaf05_profiling import profiled  # noqa: E402
+
+
+def main() -> int:
+    with profiled('6railwayplanning') as profiler:
+        with profiler.phase('build'):
+            network, required_flow, removals = _load_network()
+
+        with profiler.phase('solve'):
+            network.maximize()
+            n_removed, flow = _remove_routes(network, required_flow, removals)
+
+        with profiler.phase('output'):
+            print(n_removed, flow)
+
+    return 0
+
+
+def _load_network() -> tuple[IncrementalMaxFlow, int, list[int]]:
+    """Load the railway network, the required flow and the planned removals from stdin."""
+    n_nodes, n_routes, required_flow, n_removals = _read_row_as_ints()
+
+    # source is the first node and sink the last
+    network = IncrementalMaxFlow(n_nodes, source=0, sink=n_nodes - 1)
+    for _ in range(n_routes):
+        node_1, node_2, capacity = _read_row_as_ints()
+        # route i gets edge identifier i
+        network.add_edge(node_1, node_2, capacity)
+
+    removals = [int(input()) for _ in range(n_removals)]
+
+    return network, required_flow, removals
+
+
+def _read_row_as_ints() -> list[int]:
+    return [int(nbr) for nbr in input().split()]
+
+
+def _remove_routes(network: IncrementalMaxFlow, required_flow: int, removals: list[int]) -> tuple[int, int]:
+    """Remove routes in order for as long as the required flow can still be delivered.
+
+    Returns the number of removed routes and the maximum flow after removing them.
+    """
+    flow = network.value
+    for n_removed, route in enumerate(removals):
+        next_flow = network.remove_edge(route)
+        if next_flow < required_flow:
+            return n_removed, flow
+        flow = next_flow
+
+    return len(removals), flow
+
+
+if __name__ == '__main__':
+    sys.exit(main())
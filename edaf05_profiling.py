@@ -0,0 +1,240 @@
+"""Opt-in timing and memory instrumentation shared by the lab entry points.
+
+Nothing is measured unless profiling is switched on, and stdout is never touched,
+so `check_solution.sh` keeps working. Switch it on with a CLI flag or environment
+variable (the flag wins):
+
+    --profile             EDAF05_PROFILE=1             per-phase wall time on stderr
+    --profile=PATH        EDAF05_PROFILE=PATH          append one JSON line per run to PATH
+    --profile-memory      EDAF05_PROFILE_MEMORY=1      also record each phase's tracemalloc peak
+    --cprofile=PREFIX     EDAF05_CPROFILE=PREFIX       write PREFIX.prof (cProfile)
+    --sample=PREFIX       EDAF05_SAMPLE=PREFIX         write PREFIX.collapsed (sampled stacks for flamegraph.pl)
+
+Every phase records its wall time from `perf_counter_ns`. Only a plain `--profile`
+run gives undistorted times: tracemalloc, cProfile and the stack sampler all slow
+the program down, allocation-heavy and call-heavy code the most, so the phase
+times of a run that uses any of them include that overhead and should not be
+compared with each other. cProfile and the sampler cannot be combined, as the
+samples would then show mostly cProfile. For example, to collect the phase times
+of every test case:
+
+    EDAF05_PROFILE=profile.jsonl bash check_solution.sh python3 main.py
+"""
+from __future__ import annotations
+
+import collections
+import contextlib
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import abc
+from dataclasses import asdict, dataclass, field
+
+PROFILE_FLAG = '--profile'
+MEMORY_FLAG = '--profile-memory'
+CPROFILE_FLAG = '--cprofile'
+SAMPLE_FLAG = '--sample'
+PROFILE_ENV = 'EDAF05_PROFILE'
+MEMORY_ENV = 'EDAF05_PROFILE_MEMORY'
+CPROFILE_ENV = 'EDAF05_CPROFILE'
+SAMPLE_ENV = 'EDAF05_SAMPLE'
+
+# interval between stack samples for the collapsed-stack output
+_SAMPLE_INTERVAL_S = 0.001
+
+
+@dataclass(slots=True)
+class Phase:
+    name: str
+    time_ns: int
+    peak_memory_bytes: int | None  # None unless memory is traced
+
+
+@dataclass
+class Profiler:
+    """Time and memory of named phases of one program run."""
+    program: str
+    enabled: bool = False
+    report_path: str | None = None  # None reports to stderr
+    trace_memory: bool = False
+    cprofile_prefix: str | None = None
+    sample_prefix: str | None = None
+    phases: list[Phase] = field(default_factory=list)
+    _cprofile: cProfile.Profile | None = field(default=None, repr=False)
+    _sampler: _StackSampler | None = field(default=None, repr=False)
+    _start_ns: int = field(default=0, repr=False)
+
+    @classmethod
+    def from_environment(cls, program: str, argv: list[str] | None = None) -> Profiler:
+        """Configure from command line flags and environment variables.
+
+        The profiling flags are removed from `argv` (default `sys.argv`), so the
+        program's own argument handling never sees them.
+        """
+        argv = sys.argv if argv is None else argv
+        profile = os.environ.get(PROFILE_ENV) or None
+        trace_memory = os.environ.get(MEMORY_ENV, '0') != '0'
+        cprofile_prefix = os.environ.get(CPROFILE_ENV) or None
+        sample_prefix = os.environ.get(SAMPLE_ENV) or None
+
+        for argument in list(argv[1:]):
+            flag, _, value = argument.partition('=')
+            if flag == PROFILE_FLAG:
+                profile = value or '1'
+            elif flag == MEMORY_FLAG and not value:
+                trace_memory = True
+            elif flag == CPROFILE_FLAG and value:
+                cprofile_prefix = value
+            elif flag == SAMPLE_FLAG and value:
+                sample_prefix = value
+            else:
+                continue
+            argv.remove(argument)
+
+        if cprofile_prefix is not None and sample_prefix is not None:
+            raise ValueError(f'{CPROFILE_FLAG} and {SAMPLE_FLAG} distort each other; use one per run')
+
+        enabled = (
+            bool(profile and profile != '0')
+            or trace_memory
+            or cprofile_prefix is not None
+            or sample_prefix is not None
+        )
+        report_path = profile if profile not in (None, '0', '1') else None
+        return cls(
+            program,
+            enabled=enabled,
+            report_path=report_path,
+            trace_memory=trace_memory,
+            cprofile_prefix=cprofile_prefix,
+            sample_prefix=sample_prefix,
+        )
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.sample_prefix:
+            self._sampler = _StackSampler(threading.current_thread().ident)
+            self._sampler.start()
+        if self.cprofile_prefix:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._start_ns = time.perf_counter_ns()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> abc.Generator[None, None, None]:
+        """Measure the enclosed block as one named phase."""
+        if not self.enabled:
+            yield
+            return
+
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start
+            peak = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+            self.phases.append(Phase(name, elapsed_ns, peak))
+
+    def stop(self) -> None:
+        """Stop measuring and write the report."""
+        if not self.enabled:
+            return
+
+        total_ns = time.perf_counter_ns() - self._start_ns
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(f'{self.cprofile_prefix}.prof')
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler.write(f'{self.sample_prefix}.collapsed')
+        if self.trace_memory:
+            tracemalloc.stop()
+
+        report = {
+            'program': self.program,
+            'input': _stdin_name(),
+            'total_ns': total_ns,
+            # the phase times only compare fairly when nothing else was measured
+            'overhead': [
+                tool for tool, used in (
+                    ('tracemalloc', self.trace_memory),
+                    ('cProfile', self._cprofile is not None),
+                    ('sampler', self._sampler is not None),
+                ) if used
+            ],
+            'phases': [asdict(phase) for phase in self.phases],
+        }
+        if self.report_path:
+            with open(self.report_path, 'a') as file:
+                file.write(json.dumps(report) + '\n')
+        else:
+            _print_report(report)
+
+
+@contextlib.contextmanager
+def profiled(program: str) -> abc.Generator[Profiler, None, None]:
+    """Run the enclosed block under a profiler configured from the environment."""
+    profiler = Profiler.from_environment(program)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+
+
+class _StackSampler(threading.Thread):
+    """Periodically sample the stack of one thread and count collapsed stacks."""
+
+    def __init__(self, thread_id: int) -> None:
+        super().__init__(daemon=True)
+        self._thread_id = thread_id
+        self._stop_event = threading.Event()
+        self.counts: collections.Counter[str] = collections.Counter()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(_SAMPLE_INTERVAL_S):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+                frame = frame.f_back
+            if stack:
+                self.counts[';'.join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def write(self, path: str) -> None:
+        with open(path, 'w') as file:
+            for stack, count in self.counts.most_common():
+                file.write(f'{stack} {count}\n')
+
+
+def _stdin_name() -> str | None:
+    """Name of the file redirected to stdin, where the platform exposes it."""
+    try:
+        return os.readlink('/proc/self/fd/0')
+    except OSError:
+        return None
+
+
+def _print_report(report: dict) -> None:
+    overhead = f" (times include {', '.join(report['overhead'])} overhead)" if report['overhead'] else ''
+    print(f"{report['program']}: {report['total_ns'] / 1e6:.2f} ms total{overhead}", file=sys.stderr)
+    for phase in report['phases']:
+        line = f"  {phase['name']:<8} {phase['time_ns'] / 1e6:>10.2f} ms"
+        if phase['peak_memory_bytes'] is not None:
+            line += f" {phase['peak_memory_bytes'] / 2**20:>10.2f} MiB peak"
+        print(line, file=sys.stderr)